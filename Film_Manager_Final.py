@@ -1,10 +1,59 @@
 import json
 import os
-from datetime import datetime
+import shutil
+import sys
+import time
 from typing import List, Dict, Optional
-from collections import Counter
+from collections import Counter, defaultdict
 import functools
 
+# Optional fast JSON backend - falls back to stdlib json if not installed
+try:
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# Optional binary persistence backend - JSON remains the fallback and
+# human-readable export format
+try:
+    import msgpack
+    _HAS_MSGPACK = True
+except ImportError:
+    _HAS_MSGPACK = False
+
+DEFAULT_DATA_FILE = 'show_manager_data.msgpack' if _HAS_MSGPACK else 'show_manager_data.json'
+
+
+def _json_dumps(data, indent: bool = True) -> bytes:
+    """Serialize data to JSON bytes using the fastest available backend"""
+    if _HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    """Deserialize JSON bytes using the fastest available backend"""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Action logging can be switched off for bulk operations where the
+# per-call timestamp formatting becomes measurable
+LOG_ENABLED = True
+
+
+def set_logging(enabled: bool):
+    """Enable or disable action logging (e.g. for bulk imports)"""
+    global LOG_ENABLED
+    LOG_ENABLED = enabled
+
 
 # Decorator for logging actions
 def log_action(func):
@@ -12,8 +61,10 @@ def log_action(func):
 
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if not LOG_ENABLED:
+            return func(*args, **kwargs)
         result = func(*args, **kwargs)
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
         print(f"[{timestamp}] Action: {func.__name__} completed")
         return result
 
@@ -31,7 +82,10 @@ class DataPersistence:
 
     def __enter__(self):
         try:
-            self.file = open(self.filename, self.mode, encoding='utf-8')
+            if 'b' in self.mode:
+                self.file = open(self.filename, self.mode)
+            else:
+                self.file = open(self.filename, self.mode, encoding='utf-8')
             return self.file
         except FileNotFoundError:
             if 'r' in self.mode:
@@ -47,18 +101,38 @@ class DataPersistence:
 class Show:
     """Represents a film/show with its properties"""
 
+    __slots__ = ('_title', '_title_lc', '_genre', '_duration', '_rating',
+                 '_user_ratings', '_rating_sum', '_rating_count',
+                 '_str_cache', '_repr_cache')
+
+    # Bumped whenever any show's rating changes, so rating-ordered
+    # caches can detect staleness cheaply
+    _ratings_version = 0
+
     def __init__(self, title: str, genre: str, duration: int, rating: float = 0.0):
         self._title = title
+        self._title_lc = title.lower()  # cached for comparisons and lookups
         self._genre = genre
         self._duration = duration  # in minutes
         self._rating = rating
         self._user_ratings = []
+        # Running sum/count so the average is O(1) per added rating
+        self._rating_sum = 0.0
+        self._rating_count = 0
+        # Cached string forms; only the rating can change, so these are
+        # invalidated when it does
+        self._str_cache = None
+        self._repr_cache = None
 
     # Encapsulation with properties
     @property
     def title(self):
         return self._title
 
+    @property
+    def title_lc(self):
+        return self._title_lc
+
     @property
     def genre(self):
         return self._genre
@@ -75,32 +149,46 @@ class Show:
     def rating(self, value: float):
         if 0 <= value <= 10:
             self._rating = value
+            self._rating_changed()
         else:
             raise ValueError("Rating must be between 0 and 10")
 
+    def _rating_changed(self):
+        """Invalidate caches that depend on the rating"""
+        self._str_cache = None
+        self._repr_cache = None
+        Show._ratings_version += 1
+
     def add_user_rating(self, rating: float):
         """Add a user rating and update average"""
         if 0 <= rating <= 10:
             self._user_ratings.append(rating)
-            self._rating = sum(self._user_ratings) / len(self._user_ratings)
+            self._rating_sum += rating
+            self._rating_count += 1
+            self._rating = self._rating_sum / self._rating_count
+            self._rating_changed()
         else:
             raise ValueError("Rating must be between 0 and 10")
 
     # Dunder methods
     def __repr__(self) -> str:
-        return f"Show('{self._title}', '{self._genre}', {self._duration}min, {self._rating:.1f})"
+        if self._repr_cache is None:
+            self._repr_cache = f"Show('{self._title}', '{self._genre}', {self._duration}min, {self._rating:.1f})"
+        return self._repr_cache
 
     def __str__(self) -> str:
-        return f"{self._title} ({self._genre}) - {self._duration}min - Rating: {self._rating:.1f}/10"
+        if self._str_cache is None:
+            self._str_cache = f"{self._title} ({self._genre}) - {self._duration}min - Rating: {self._rating:.1f}/10"
+        return self._str_cache
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Show):
             return False
-        return self._title.lower() == other._title.lower()
+        return self._title_lc == other._title_lc
 
     def __hash__(self) -> int:
         """Make Show hashable for use in dictionaries"""
-        return hash(self._title.lower())
+        return hash(self._title_lc)
 
     def __lt__(self, other) -> bool:
         """For sorting by rating"""
@@ -125,16 +213,32 @@ class Show:
         """Create Show instance from dictionary"""
         show = cls(data['title'], data['genre'], data['duration'], data['rating'])
         show._user_ratings = data.get('user_ratings', [])
+        show._rating_sum = sum(show._user_ratings)
+        show._rating_count = len(show._user_ratings)
         return show
 
 
 class User:
     """Represents a user with watchlist and watched history"""
 
+    __slots__ = ('_username', '_watchlist', '_watched', '_watchlist_titles',
+                 '_watched_titles', '_ratings_sum', '_ratings_count',
+                 '_genre_counter', '_watch_time')
+
     def __init__(self, username: str):
         self._username = username
         self._watchlist: List[Show] = []
         self._watched: Dict[Show, Optional[float]] = {}  # Show: user_rating
+        # Lowercased title indexes for O(1) membership checks
+        self._watchlist_titles: set = set()
+        self._watched_titles: set = set()
+        # Running aggregates of ratings given, so stats are O(1)
+        self._ratings_sum: float = 0.0
+        self._ratings_count: int = 0
+        # Incrementally updated genre counts of watched shows
+        self._genre_counter: Counter = Counter()
+        # Running total of watched minutes, so watch time is O(1)
+        self._watch_time: int = 0
 
     @property
     def username(self) -> str:
@@ -151,28 +255,50 @@ class User:
     @log_action
     def add_to_watchlist(self, show: Show):
         """Add show to user's watchlist"""
+        title = show.title_lc
+
         # Check if already in watchlist
-        if any(s.title.lower() == show.title.lower() for s in self._watchlist):
+        if title in self._watchlist_titles:
             print(f"[X] '{show.title}' is already in watchlist")
             return False
 
         # Check if already watched
-        if any(s.title.lower() == show.title.lower() for s in self._watched.keys()):
+        if title in self._watched_titles:
             print(f"[X] '{show.title}' is already watched")
             return False
 
         self._watchlist.append(show)
+        self._watchlist_titles.add(title)
         print(f"[OK] '{show.title}' added to {self._username}'s watchlist")
         return True
 
     @log_action
     def mark_as_watched(self, show: Show, user_rating: Optional[float] = None):
         """Mark show as watched and optionally rate it"""
+        title = show.title_lc
+
         # Remove from watchlist if present
-        self._watchlist = [s for s in self._watchlist if s.title.lower() != show.title.lower()]
+        if title in self._watchlist_titles:
+            self._watchlist = [s for s in self._watchlist if s.title_lc != title]
+            self._watchlist_titles.discard(title)
+
+        # If re-marking an already watched show, retract its old rating;
+        # only count the genre the first time a show is watched
+        if show in self._watched:
+            old_rating = self._watched[show]
+            if old_rating is not None:
+                self._ratings_sum -= old_rating
+                self._ratings_count -= 1
+        else:
+            self._genre_counter[show.genre] += 1
+            self._watch_time += show.duration
 
         # Add to watched
         self._watched[show] = user_rating
+        self._watched_titles.add(title)
+        if user_rating is not None:
+            self._ratings_sum += user_rating
+            self._ratings_count += 1
 
         if user_rating is not None:
             show.add_user_rating(user_rating)
@@ -183,17 +309,17 @@ class User:
 
     def get_total_watch_time(self) -> int:
         """Calculate total time spent watching (in minutes)"""
-        return sum(show.duration for show in self._watched.keys())
+        return self._watch_time
 
     def get_genre_distribution(self) -> Dict[str, int]:
         """Get distribution of watched genres"""
-        genres = [show.genre for show in self._watched.keys()]
-        return dict(Counter(genres))
+        return dict(self._genre_counter)
 
     def get_average_rating_given(self) -> float:
         """Calculate average rating given by user"""
-        ratings = [r for r in self._watched.values() if r is not None]
-        return sum(ratings) / len(ratings) if ratings else 0.0
+        if self._ratings_count == 0:
+            return 0.0
+        return self._ratings_sum / self._ratings_count
 
     # Dunder methods
     def __repr__(self) -> str:
@@ -211,43 +337,80 @@ class User:
         return True
 
     def to_dict(self) -> Dict:
-        """Convert user to dictionary for JSON serialization"""
+        """Convert user to dictionary for JSON serialization.
+
+        Shows are stored once at the top level of the data file, so user
+        records only keep title references instead of full show copies.
+        """
         return {
             'username': self._username,
-            'watchlist': [show.to_dict() for show in self._watchlist],
+            'watchlist': [show.title for show in self._watchlist],
             'watched': [
-                {'show': show.to_dict(), 'user_rating': rating}
+                {'title': show.title, 'user_rating': rating}
                 for show, rating in self._watched.items()
             ]
         }
 
+    @staticmethod
+    def _resolve_show(entry, all_shows: Dict[str, Show]) -> Show:
+        """Resolve a persisted show reference against the show library.
+
+        New-format records store a title string; legacy records embedded
+        the full show dict, which is still accepted.
+        """
+        if isinstance(entry, str):
+            show = all_shows.get(entry)
+            if show is None:
+                raise KeyError(f"unknown show '{entry}' referenced in user record")
+            return show
+
+        # Legacy format: full show dict embedded in the user record
+        show_title = entry['title']
+        show = all_shows.get(show_title)
+        if show is None:
+            show = Show.from_dict(entry)
+            all_shows[show_title] = show
+        return show
+
     @classmethod
     def from_dict(cls, data: Dict, all_shows: Dict[str, Show]) -> 'User':
         """Create User instance from dictionary"""
         user = cls(data['username'])
 
-        # Restore watchlist
-        for show_data in data.get('watchlist', []):
-            show_title = show_data['title']
-            # Use existing show from library or create new one
-            if show_title in all_shows:
-                show = all_shows[show_title]
-            else:
-                show = Show.from_dict(show_data)
-                all_shows[show_title] = show
-            user._watchlist.append(show)
-
-        # Restore watched
+        # Restore watchlist: current files store plain title strings, so
+        # try the direct-lookup fast path; fall back per entry for legacy
+        # records with embedded show dicts
+        watchlist_data = data.get('watchlist', [])
+        try:
+            user._watchlist = [all_shows[title] for title in watchlist_data]
+        except (KeyError, TypeError):
+            user._watchlist = [cls._resolve_show(entry, all_shows)
+                               for entry in watchlist_data]
+        user._watchlist_titles = {show.title_lc for show in user._watchlist}
+
+        # Restore watched in a single pass, filling the derived indexes
+        # inline; bind loop invariants locally to avoid per-entry
+        # attribute lookups on large histories
+        resolve = cls._resolve_show
+        watched = user._watched
+        watched_titles = user._watched_titles
+        genre_counter = user._genre_counter
+        ratings_sum = 0.0
+        ratings_count = 0
+        watch_time = 0
         for item in data.get('watched', []):
-            show_data = item['show']
-            show_title = show_data['title']
-            # Use existing show from library or create new one
-            if show_title in all_shows:
-                show = all_shows[show_title]
-            else:
-                show = Show.from_dict(show_data)
-                all_shows[show_title] = show
-            user._watched[show] = item['user_rating']
+            show = resolve(item.get('show') or item['title'], all_shows)
+            rating = item['user_rating']
+            watched[show] = rating
+            watched_titles.add(show.title_lc)
+            genre_counter[show.genre] += 1
+            watch_time += show.duration
+            if rating is not None:
+                ratings_sum += rating
+                ratings_count += 1
+        user._ratings_sum = ratings_sum
+        user._ratings_count = ratings_count
+        user._watch_time = watch_time
 
         return user
 
@@ -255,10 +418,21 @@ class User:
 class ShowManager:
     """Main manager class that coordinates shows and users (Composition pattern)"""
 
-    def __init__(self, data_file: str = 'show_manager_data.json'):
+    def __init__(self, data_file: str = DEFAULT_DATA_FILE):
         self._shows: Dict[str, Show] = {}  # title: Show
+        self._shows_lc: Dict[str, Show] = {}  # lowercased title: Show
+        self._by_genre: Dict[str, List[Show]] = defaultdict(list)  # genre: shows
         self._users: Dict[str, User] = {}  # username: User
+        self._users_lc: Dict[str, User] = {}  # lowercased username: User
+        # Users still on disk, loaded on first access: username -> byte offset
+        self._user_offsets: Dict[str, int] = {}
+        self._user_names_lc: Dict[str, str] = {}  # lowercased name: pending name
         self._data_file = data_file
+        self._use_msgpack = _HAS_MSGPACK and data_file.endswith('.msgpack')
+        self._dirty = False  # unsaved in-memory changes
+        # Rating-sorted show list, cached until the catalog or a rating changes
+        self._sorted_shows_cache: Optional[List[Show]] = None
+        self._sorted_shows_key = (-1, -1)
         self.load_data()
 
     @log_action
@@ -270,8 +444,10 @@ class ShowManager:
 
         show = Show(title, genre, duration, rating)
         self._shows[title] = show
+        self._shows_lc[show.title_lc] = show
+        self._by_genre[genre].append(show)
         print(f"[OK] Show added: {show}")
-        self.save_data()
+        self._mark_dirty()
 
     @log_action
     def create_user(self, username: str):
@@ -282,43 +458,79 @@ class ShowManager:
 
         user = User(username)
         self._users[username] = user
+        self._users_lc[username.lower()] = user
         print(f"[OK] User created: {user}")
-        self.save_data()
+        self._mark_dirty()
 
     def get_user(self, username: str) -> Optional[User]:
         """Get user by username (case-insensitive with suggestions)"""
-        # Try exact match first
-        if username in self._users:
-            return self._users[username]
+        # Try exact match first, then the lowercase index, then any user
+        # record still pending in the data file
+        user = self._users.get(username) or self._users_lc.get(username.lower())
+        if user is None and self._user_offsets:
+            user = self._load_pending_user(username)
+        if user is None:
+            self._print_user_suggestions(username)
+        return user
 
-        # Try case-insensitive match
-        for user_name, user in self._users.items():
-            if user_name.lower() == username.lower():
-                return user
+    def _load_pending_user(self, username: str) -> Optional[User]:
+        """Load a single user record from the data file on first access"""
+        if username in self._user_offsets:
+            name = username
+        else:
+            name = self._user_names_lc.get(username.lower())
+        if name is None:
+            return None
+
+        offset = self._user_offsets.pop(name)
+        self._user_names_lc.pop(name.lower(), None)
+        try:
+            with DataPersistence(self._data_file, 'rb') as f:
+                if f is None:
+                    return None
+                f.seek(offset)
+                user = User.from_dict(_json_loads(f.readline()), self._shows)
+        except Exception as e:
+            print(f"[X] Error loading user {name}: {e}")
+            return None
+
+        self._users[user.username] = user
+        self._users_lc[user.username.lower()] = user
+        return user
+
+    def _ensure_all_users_loaded(self):
+        """Materialize every user still pending in the data file (needed
+        before a full save or user listing)"""
+        for name in list(self._user_offsets):
+            self._load_pending_user(name)
 
-        # User not found - suggest similar usernames
+    def _print_user_suggestions(self, username: str):
+        """Report a failed user lookup and list existing usernames"""
         print(f"[X] User '{username}' not found")
-        if self._users:
+        known = list(self._users.keys()) + list(self._user_offsets.keys())
+        if known:
             print(f"\nAvailable users:")
-            for i, user_name in enumerate(self._users.keys(), 1):
+            for i, user_name in enumerate(known, 1):
                 print(f"  {i}. {user_name}")
         else:
             print("No users exist yet. Create a user first (Option 1)")
 
-        return None
-
     def get_show(self, title: str) -> Optional[Show]:
         """Get show by title (case-insensitive)"""
-        # Try exact match first
-        if title in self._shows:
-            return self._shows[title]
-
-        # Try case-insensitive match
-        for show_title, show in self._shows.items():
-            if show_title.lower() == title.lower():
-                return show
-
-        return None
+        # Try exact match first, then the lowercase index
+        show = self._shows.get(title)
+        if show is not None:
+            return show
+        return self._shows_lc.get(title.lower())
+
+    def _sorted_shows(self) -> List[Show]:
+        """Shows sorted by rating (descending), re-sorted only when the
+        catalog grows or any rating changes"""
+        key = (len(self._shows), Show._ratings_version)
+        if self._sorted_shows_cache is None or self._sorted_shows_key != key:
+            self._sorted_shows_cache = sorted(self._shows.values(), reverse=True)
+            self._sorted_shows_key = key
+        return self._sorted_shows_cache
 
     def list_all_shows(self):
         """Display all available shows"""
@@ -326,25 +538,22 @@ class ShowManager:
             print("No shows available in the library")
             return
 
-        print("\n" + "=" * 60)
-        print("ALL AVAILABLE SHOWS")
-        print("=" * 60)
-        for i, show in enumerate(sorted(self._shows.values(), reverse=True), 1):
-            print(f"{i}. {show}")
-        print("=" * 60)
+        lines = ["", "=" * 60, "ALL AVAILABLE SHOWS", "=" * 60]
+        lines.extend(f"{i}. {show}" for i, show in enumerate(self._sorted_shows(), 1))
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def list_all_users(self):
         """Display all users"""
+        self._ensure_all_users_loaded()
         if not self._users:
             print("No users in the system")
             return
 
-        print("\n" + "=" * 60)
-        print("ALL USERS")
-        print("=" * 60)
-        for i, user in enumerate(self._users.values(), 1):
-            print(f"{i}. {user}")
-        print("=" * 60)
+        lines = ["", "=" * 60, "ALL USERS", "=" * 60]
+        lines.extend(f"{i}. {user}" for i, user in enumerate(self._users.values(), 1))
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def view_user_watchlist(self, username: str):
         """Display user's watchlist"""
@@ -357,12 +566,10 @@ class ShowManager:
             print(f"\n{username}'s watchlist is empty")
             return
 
-        print(f"\n{'=' * 60}")
-        print(f"{username.upper()}'S WATCHLIST")
-        print("=" * 60)
-        for i, show in enumerate(watchlist, 1):
-            print(f"{i}. {show}")
-        print("=" * 60)
+        lines = ["", "=" * 60, f"{username.upper()}'S WATCHLIST", "=" * 60]
+        lines.extend(f"{i}. {show}" for i, show in enumerate(watchlist, 1))
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def add_show_to_watchlist(self, username: str):
         """Add a show to user's watchlist (complete workflow)"""
@@ -390,7 +597,7 @@ class ShowManager:
 
         # Add to watchlist
         if user.add_to_watchlist(show):
-            self.save_data()
+            self._mark_dirty()
 
     def mark_show_as_watched(self, username: str):
         """Mark a show as watched (complete workflow)"""
@@ -430,7 +637,7 @@ class ShowManager:
 
         # Mark as watched
         if user.mark_as_watched(show, rating):
-            self.save_data()
+            self._mark_dirty()
 
     def get_recommendations(self, username: str, limit: int = 5):
         """Recommend shows based on user's watched genres"""
@@ -446,15 +653,15 @@ class ShowManager:
 
         favorite_genre = max(genre_dist, key=genre_dist.get)
 
-        # Find unwatched shows in favorite genre
-        watched_titles = {show.title.lower() for show in user.watched.keys()}
-        watchlist_titles = {show.title.lower() for show in user.watchlist}
+        # Find unwatched shows in favorite genre using the genre index
+        # and the user's cached title sets
+        watched_titles = user._watched_titles
+        watchlist_titles = user._watchlist_titles
 
         recommendations = [
-            show for show in self._shows.values()
-            if show.genre == favorite_genre
-               and show.title.lower() not in watched_titles
-               and show.title.lower() not in watchlist_titles
+            show for show in self._by_genre.get(favorite_genre, [])
+            if show.title_lc not in watched_titles
+               and show.title_lc not in watchlist_titles
         ]
 
         # Sort by rating
@@ -498,56 +705,137 @@ class ShowManager:
 
         print("=" * 60)
 
-    def save_data(self):
-        """Save all data to JSON file using context manager"""
-        data = {
+    def _mark_dirty(self):
+        """Record that in-memory state has unsaved changes"""
+        self._dirty = True
+
+    def flush(self):
+        """Persist pending changes, if any"""
+        if self._dirty:
+            self.save_data()
+
+    def _dump_stream(self, f):
+        """Stream the library as line-delimited JSON: a header line holding
+        the shows and a username index, then one user record per line.
+
+        Keeping each user on its own line lets load_data defer user
+        parsing and re-read individual records lazily by byte offset.
+        Objects are still encoded one at a time, so the whole payload is
+        never materialized in memory at once.
+        """
+        f.write(b'{"version": 3, "users_index": ')
+        f.write(_json_dumps(list(self._users.keys()), indent=False))
+        f.write(b', "shows": [')
+        for i, show in enumerate(self._shows.values()):
+            if i:
+                f.write(b', ')
+            f.write(_json_dumps(show.to_dict(), indent=False))
+        f.write(b']}\n')
+        for user in self._users.values():
+            f.write(_json_dumps(user.to_dict(), indent=False))
+            f.write(b'\n')
+
+    def _to_payload(self) -> Dict:
+        """Build the full persistence payload as one dictionary"""
+        return {
+            'version': 2,
             'shows': [show.to_dict() for show in self._shows.values()],
             'users': [user.to_dict() for user in self._users.values()]
         }
 
+    def save_data(self):
+        """Save all data to disk atomically (tmp file + rename)"""
+        # A save rewrites the whole file, so any users still pending on
+        # disk must be materialized first or they would be dropped
+        self._ensure_all_users_loaded()
+        tmp_file = self._data_file + '.tmp'
         try:
-            with DataPersistence(self._data_file, 'w') as f:
+            with DataPersistence(tmp_file, 'wb') as f:
                 if f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                    print(f"[OK] Data saved to {self._data_file}")
+                    if self._use_msgpack:
+                        f.write(msgpack.packb(self._to_payload(), use_bin_type=True))
+                    else:
+                        self._dump_stream(f)
+            os.replace(tmp_file, self._data_file)
+            self._dirty = False
+            print(f"[OK] Data saved to {self._data_file}")
         except Exception as e:
             print(f"[X] Error saving data: {e}")
 
+    def _clear_state(self):
+        """Reset all in-memory data and secondary indexes"""
+        self._shows.clear()
+        self._shows_lc.clear()
+        self._by_genre.clear()
+        self._users.clear()
+        self._users_lc.clear()
+        self._user_offsets.clear()
+        self._user_names_lc.clear()
+        self._sorted_shows_cache = None
+
+    def _index_pending_users(self, usernames: List[str], f, offset: int):
+        """Record the byte offset of each user line for lazy loading"""
+        for name in usernames:
+            line = f.readline()
+            if not line:
+                break
+            self._user_offsets[name] = offset
+            self._user_names_lc[name.lower()] = name
+            offset += len(line)
+
     def load_data(self):
-        """Load data from JSON file using context manager"""
-        with DataPersistence(self._data_file, 'r') as f:
+        """Load data from the data file using context manager"""
+        with DataPersistence(self._data_file, 'rb') as f:
             if f is None:
                 print(f"[!] No existing data file found. Starting fresh.\n")
                 return
 
             try:
-                data = json.load(f)
+                self._clear_state()
 
-                # Clear existing data
-                self._shows.clear()
-                self._users.clear()
+                if self._use_msgpack:
+                    data = msgpack.unpackb(f.read(), raw=False)
+                else:
+                    first_line = f.readline()
+                    try:
+                        data = _json_loads(first_line)
+                    except ValueError:
+                        # Pretty-printed legacy file: parse it whole
+                        data = _json_loads(first_line + f.read())
+                    if 'users_index' in data:
+                        # v3 line-delimited file: only index the user
+                        # records now, parse each on first access
+                        self._index_pending_users(data['users_index'], f, len(first_line))
 
                 # Load shows first
                 for show_data in data.get('shows', []):
                     show = Show.from_dict(show_data)
                     self._shows[show.title] = show
 
-                # Load users with proper show references
+                # Load users eagerly for legacy full payloads
                 for user_data in data.get('users', []):
                     try:
                         user = User.from_dict(user_data, self._shows)
                         self._users[user.username] = user
+                        self._users_lc[user.username.lower()] = user
                     except Exception as e:
                         print(f"[X] Error loading user {user_data.get('username', 'unknown')}: {e}")
 
+                # Rebuild secondary indexes in one pass (covers shows that
+                # were only embedded in user records)
+                for show in self._shows.values():
+                    self._shows_lc[show.title_lc] = show
+                    self._by_genre[show.genre].append(show)
+
+                usernames = list(self._users.keys()) + list(self._user_offsets.keys())
                 print(f"[OK] Data loaded successfully!")
                 print(f"     Shows: {len(self._shows)}")
-                print(f"     Users: {len(self._users)}")
-                if self._users:
-                    print(f"     Available users: {', '.join(self._users.keys())}")
+                print(f"     Users: {len(usernames)}")
+                if usernames:
+                    print(f"     Available users: {', '.join(usernames)}")
                 print()
 
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 print(f"[X] Error loading data file: {e}. Starting fresh.\n")
             except Exception as e:
                 print(f"[X] Unexpected error loading data: {e}. Starting fresh.\n")
@@ -563,10 +851,21 @@ class ShowManager:
         print(f"File location: {os.path.abspath(self._data_file)}")
         print("=" * 60)
 
-        with DataPersistence(self._data_file, 'r') as f:
+        with DataPersistence(self._data_file, 'rb') as f:
             if f:
-                content = f.read()
-                print(content)
+                if self._use_msgpack:
+                    # Binary format: export as readable JSON for display
+                    content = _json_dumps(msgpack.unpackb(f.read(), raw=False))
+                    print(content.decode('utf-8'))
+                elif os.path.getsize(self._data_file) < 4096:
+                    # Small file: read and print in one go
+                    print(f.read().decode('utf-8'))
+                else:
+                    # Stream raw bytes to stdout in O(1) memory
+                    sys.stdout.flush()
+                    shutil.copyfileobj(f, sys.stdout.buffer, length=64 * 1024)
+                    sys.stdout.buffer.flush()
+                    print()
         print("=" * 60)
 
     def __len__(self) -> int:
@@ -633,6 +932,66 @@ def quick_demo():
     print("Run the program again to see the data persist!")
 
 
+# Menu handlers: each takes the manager and returns True to end the loop
+def _menu_quick_demo(manager):
+    quick_demo()
+    return True
+
+
+def _menu_create_user(manager):
+    username = input("Enter username: ").strip()
+    if username:
+        manager.create_user(username)
+
+
+def _menu_add_show(manager):
+    title = input("Enter show title: ").strip()
+    genre = input("Enter genre: ").strip()
+    try:
+        duration = int(input("Enter duration (minutes): ").strip())
+        rating = float(input("Enter initial rating (0-10, default 0): ").strip() or "0")
+        manager.add_show(title, genre, duration, rating)
+    except ValueError:
+        print("[X] Invalid input. Please enter valid numbers.")
+
+
+def _menu_exit(manager):
+    save_choice = input("Save data before exit? (y/n): ").strip().lower()
+    if save_choice == 'y':
+        manager.flush()
+    print("\nThank you for using Show Manager! Goodbye!")
+    return True
+
+
+def _with_username(method_name):
+    """Build a menu handler that prompts for a username and forwards it"""
+
+    def handler(manager):
+        username = input("Enter username: ").strip()
+        if username:
+            getattr(manager, method_name)(username)
+
+    return handler
+
+
+# Dispatch table: a dict probe replaces the old 13-way if/elif chain
+MENU = {
+    '0': _menu_quick_demo,
+    '1': _menu_create_user,
+    '2': _menu_add_show,
+    '3': lambda manager: manager.list_all_shows(),
+    '4': lambda manager: manager.list_all_users(),
+    '5': _with_username('add_show_to_watchlist'),
+    '6': _with_username('view_user_watchlist'),
+    '7': _with_username('mark_show_as_watched'),
+    '8': _with_username('get_recommendations'),
+    '9': _with_username('show_user_statistics'),
+    '10': lambda manager: manager.view_saved_data(),
+    '11': lambda manager: manager.save_data(),
+    '12': _menu_exit,
+}
+
+
 def main():
     """Main workflow cycle"""
     manager = ShowManager()
@@ -659,71 +1018,11 @@ def main():
 
         choice = input("\nEnter your choice (0-12): ").strip()
 
-        if choice == '0':
-            quick_demo()
-            break
-
-        elif choice == '1':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.create_user(username)
-
-        elif choice == '2':
-            title = input("Enter show title: ").strip()
-            genre = input("Enter genre: ").strip()
-            try:
-                duration = int(input("Enter duration (minutes): ").strip())
-                rating = float(input("Enter initial rating (0-10, default 0): ").strip() or "0")
-                manager.add_show(title, genre, duration, rating)
-            except ValueError:
-                print("[X] Invalid input. Please enter valid numbers.")
-
-        elif choice == '3':
-            manager.list_all_shows()
-
-        elif choice == '4':
-            manager.list_all_users()
-
-        elif choice == '5':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.add_show_to_watchlist(username)
-
-        elif choice == '6':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.view_user_watchlist(username)
-
-        elif choice == '7':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.mark_show_as_watched(username)
-
-        elif choice == '8':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.get_recommendations(username)
-
-        elif choice == '9':
-            username = input("Enter username: ").strip()
-            if username:
-                manager.show_user_statistics(username)
-
-        elif choice == '10':
-            manager.view_saved_data()
-
-        elif choice == '11':
-            manager.save_data()
-
-        elif choice == '12':
-            save_choice = input("Save data before exit? (y/n): ").strip().lower()
-            if save_choice == 'y':
-                manager.save_data()
-            print("\nThank you for using Show Manager! Goodbye!")
-            break
-
-        else:
+        handler = MENU.get(choice)
+        if handler is None:
             print("[X] Invalid choice. Please select 0-12.")
+        elif handler(manager):
+            break
 
 
 if __name__ == "__main__":